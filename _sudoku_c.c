@@ -0,0 +1,148 @@
+/*
+ * PySudoku Solver - C Solver Core
+ * -------------------------------
+ * Optional C extension implementing bitmask MRV backtracking, used when it has been built.
+ * Build in place with: python setup.py build_ext --inplace
+ *
+ * Author: thejonali (https://github.com/thejonali)
+ * License: Apache 2.0
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#if defined(_MSC_VER)
+#include <intrin.h>
+static int ctz(unsigned int x) { unsigned long i; _BitScanForward(&i, x); return (int)i; }
+static int popcount(unsigned int x) { return (int)__popcnt(x); }
+#else
+#define ctz __builtin_ctz
+#define popcount __builtin_popcount
+#endif
+
+/* Bits 1-9 set: every digit is still a candidate */
+#define ALL_CANDIDATES 0x3FE
+
+typedef struct {
+    uint8_t grid[81];
+    uint16_t row[9];
+    uint16_t col[9];
+    uint16_t box[9];
+} State;
+
+static int box_of(int i)
+{
+    return (i / 27) * 3 + (i % 9) / 3;
+}
+
+/* Fills the unit masks from the givens; returns 0 if two givens conflict. */
+static int init_masks(State *s)
+{
+    for (int i = 0; i < 81; i++) {
+        int num = s->grid[i];
+        if (num == 0)
+            continue;
+        unsigned int bit = 1u << num;
+        int r = i / 9, c = i % 9, b = box_of(i);
+        if ((s->row[r] | s->col[c] | s->box[b]) & bit)
+            return 0;
+        s->row[r] |= bit;
+        s->col[c] |= bit;
+        s->box[b] |= bit;
+    }
+    return 1;
+}
+
+/* Returns the empty cell with the fewest candidates (and its candidate mask), or -1 if full. */
+static int pick_cell(const State *s, unsigned int *best_cand)
+{
+    int best = -1, best_count = 10;
+    for (int i = 0; i < 81; i++) {
+        if (s->grid[i] != 0)
+            continue;
+        unsigned int cand = ~(s->row[i / 9] | s->col[i % 9] | s->box[box_of(i)]) & ALL_CANDIDATES;
+        int count = popcount(cand);
+        if (count < best_count) {
+            best = i;
+            *best_cand = cand;
+            best_count = count;
+            if (count <= 1)
+                break;
+        }
+    }
+    return best;
+}
+
+static int search(State *s)
+{
+    unsigned int cand = 0;
+    int i = pick_cell(s, &cand);
+    if (i < 0)
+        return 1;
+    int r = i / 9, c = i % 9, b = box_of(i);
+    while (cand) {
+        unsigned int bit = cand & (0u - cand);
+        cand ^= bit;
+        s->grid[i] = (uint8_t)ctz(bit);
+        s->row[r] |= bit;
+        s->col[c] |= bit;
+        s->box[b] |= bit;
+        if (search(s))
+            return 1;
+        s->row[r] ^= bit;
+        s->col[c] ^= bit;
+        s->box[b] ^= bit;
+    }
+    s->grid[i] = 0;
+    return 0;
+}
+
+static PyObject *sudoku_solve(PyObject *self, PyObject *args)
+{
+    Py_buffer view;
+    State s;
+
+    if (!PyArg_ParseTuple(args, "y*", &view))
+        return NULL;
+    if (view.len != 81) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_ValueError, "Grid must have 81 cells.");
+        return NULL;
+    }
+    memset(&s, 0, sizeof(s));
+    memcpy(s.grid, view.buf, 81);
+    PyBuffer_Release(&view);
+    for (int i = 0; i < 81; i++) {
+        if (s.grid[i] > 9) {
+            PyErr_SetString(PyExc_ValueError, "Cell values must be 0-9.");
+            return NULL;
+        }
+    }
+
+    int solved;
+    Py_BEGIN_ALLOW_THREADS
+    solved = init_masks(&s) && search(&s);
+    Py_END_ALLOW_THREADS
+    if (!solved)
+        Py_RETURN_NONE;
+    return PyBytes_FromStringAndSize((const char *)s.grid, 81);
+}
+
+static PyMethodDef sudoku_methods[] = {
+    {"solve", sudoku_solve, METH_VARARGS,
+     "solve(grid) -> bytes | None\n\n"
+     "Solves a flat 81-cell grid of values 0-9 (0 for empty, row-major).\n"
+     "Returns the solved grid as 81 bytes, or None if it has no solution."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef sudoku_module = {
+    PyModuleDef_HEAD_INIT, "_sudoku_c", "C solver core for PySudoku Solver.", -1, sudoku_methods
+};
+
+PyMODINIT_FUNC PyInit__sudoku_c(void)
+{
+    return PyModule_Create(&sudoku_module);
+}
@@ -6,137 +6,260 @@
 # Author: thejonali (https://github.com/thejonali)
 # License: Apache 2.0
 
-from typing import List, Optional, Tuple
+import sys
+from typing import Iterator, List, Optional, Tuple
+from functions import parse_puzzle_row
 
-def check_puzzle_solved(puzzle: List[List[int]]) -> bool:
+# Solving functions work on flat grids: 81 ints in row-major order, cell (row, col) at index row * 9 + col.
+
+# Bits 1-9 set: every digit is still a candidate
+ALL_CANDIDATES = 0x3FE
+
+# SWAR lanes for row_col_square_only_algo: digit d owns the 4 bits starting at bit 4 * (d - 1).
+# LANE_SPREAD maps a candidate bitmask to a 1 in the lowest bit of each of its digits' lanes.
+LANE_SPREAD = tuple(sum(1 << 4 * (d - 1) for d in range(1, 10) if mask >> d & 1) for mask in range(1024))
+LANE_ONES = 0x111111111
+LANE_LOW_BITS = 0x777777777
+LANE_HIGH_BITS = 0x888888888
+
+# Layout used by print_puzzle: a separator above each band of three rows, 81 cell placeholders
+PUZZLE_TEMPLATE = ('--------------------------\n' + '| {} {} {} | {} {} {} | {} {} {} |\n' * 3) * 3
+
+# Puzzles with at least this many clues skip the logic passes and go straight to backtracking
+LOGIC_CLUE_THRESHOLD = 24
+
+# Unit and peer tables of flat cell indices, computed once at import
+ROWS = tuple(tuple(row * 9 + col for col in range(9)) for row in range(9))
+COLS = tuple(tuple(row * 9 + col for row in range(9)) for col in range(9))
+BOXES = tuple(
+    tuple((x + i) * 9 + y + j for i in range(3) for j in range(3))
+    for x in (0, 3, 6) for y in (0, 3, 6)
+)
+ALL_UNITS = ROWS + COLS + BOXES
+# Box number of each cell
+BOX_OF = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+# Indices into ALL_UNITS of the row, column, and box containing each cell
+UNITS = tuple((i // 9, 9 + i % 9, 18 + BOX_OF[i]) for i in range(81))
+# The 20 cells sharing a row, column, or box with each cell
+PEERS = tuple(
+    tuple(sorted({peer for unit in UNITS[i] for peer in ALL_UNITS[unit]} - {i}))
+    for i in range(81)
+)
+
+def check_puzzle_solved(puzzle: List[int]) -> bool:
     """
     Returns True if the puzzle is completely filled (no zeros remain).
-    :param puzzle: 9x9 Sudoku grid
+    :param puzzle: Flat Sudoku grid
     :return: bool
     """
-    return all(puzzle[row][col] != 0 for row in range(9) for col in range(9))
+    return 0 not in puzzle
 
-def is_possible(puzzle: List[List[int]], x: int, y: int, num: int) -> bool:
+def check_puzzle_valid(puzzle: List[int]) -> bool:
     """
-    Checks if a number can be placed at position (x, y) without violating Sudoku rules.
-    :param puzzle: 9x9 Sudoku grid
-    :param x: Row index
-    :param y: Column index
+    Returns True if every row, column, and 3x3 box holds each digit 1-9 exactly once.
+    Each unit is checked by OR-ing one bit per cell value into a single mask.
+    :param puzzle: Flat Sudoku grid
+    :return: bool
+    """
+    for unit in ALL_UNITS:
+        mask = 0
+        for i in unit:
+            mask |= 1 << puzzle[i]
+        if mask != ALL_CANDIDATES:
+            return False
+    return True
+
+def is_possible(puzzle: List[int], i: int, num: int) -> bool:
+    """
+    Checks if a number can be placed at cell i without violating Sudoku rules.
+    :param puzzle: Flat Sudoku grid
+    :param i: Flat cell index
     :param num: Number to check (1-9)
     :return: bool
     """
-    if puzzle[x][y] != 0:
-        return False
-    if any(puzzle[x][col] == num for col in range(9)):
-        return False
-    if any(puzzle[row][y] == num for row in range(9)):
+    return puzzle[i] == 0 and all(puzzle[peer] != num for peer in PEERS[i])
+
+def fill_candidates(puzzle: List[int], puzzle_pos: List[int]) -> bool:
+    """
+    Fills puzzle_pos with the candidate bitmask of every empty cell (bit n set = n possible).
+    :param puzzle: Flat Sudoku grid
+    :param puzzle_pos: Flat list of candidate bitmasks, overwritten
+    :return: False if two givens conflict, True otherwise
+    """
+    masks = build_masks(puzzle)
+    if masks is None:
         return False
-    x0, y0 = (x // 3) * 3, (y // 3) * 3
-    for i in range(3):
-        for j in range(3):
-            if puzzle[x0 + i][y0 + j] == num:
-                return False
+    row_mask, col_mask, box_mask = masks
+    for i in range(81):
+        if puzzle[i] != 0:
+            puzzle_pos[i] = 0
+        else:
+            puzzle_pos[i] = ~(row_mask[i // 9] | col_mask[i % 9] | box_mask[BOX_OF[i]]) & ALL_CANDIDATES
     return True
 
-def row_col_square_single_algo(puzzle: List[List[int]], puzzle_pos: List[List[list]]) -> bool:
+def place_number(puzzle: List[int], puzzle_pos: List[int], i: int, num: int):
+    """
+    Places num at cell i and removes it from the candidates of the cell's 20 peers.
+    :param puzzle: Flat Sudoku grid
+    :param puzzle_pos: Flat list of candidate bitmasks
+    """
+    puzzle[i] = num
+    puzzle_pos[i] = 0
+    keep = ~(1 << num)
+    for peer in PEERS[i]:
+        puzzle_pos[peer] &= keep
+
+def row_col_square_single_algo(puzzle: List[int], puzzle_pos: List[int]) -> bool:
     """
     Fills in cells that have only one possible value based on current puzzle state.
-    Updates puzzle_pos with possible values for each cell.
-    :param puzzle: 9x9 Sudoku grid
-    :param puzzle_pos: 9x9 grid of possible values for each cell
+    :param puzzle: Flat Sudoku grid
+    :param puzzle_pos: Flat list of candidate bitmasks, kept up to date by place_number
     :return: True if a cell was filled, False otherwise
     """
-    for row in range(9):
-        for col in range(9):
-            if puzzle[row][col] != 0:
-                puzzle_pos[row][col] = []
-                continue
-            possible_nums = [num for num in range(1, 10) if is_possible(puzzle, row, col, num)]
-            if len(possible_nums) == 1:
-                puzzle[row][col] = possible_nums[0]
-                return True
-            puzzle_pos[row][col] = possible_nums
-    return False
+    filled = False
+    for i in range(81):
+        cand = puzzle_pos[i]
+        if cand and not cand & (cand - 1):
+            place_number(puzzle, puzzle_pos, i, cand.bit_length() - 1)
+            filled = True
+    return filled
 
-def row_col_square_only_algo(puzzle: List[List[int]], puzzle_pos: List[List[list]]) -> bool:
+def row_col_square_only_algo(puzzle: List[int], puzzle_pos: List[int]) -> bool:
     """
     Fills in cells where a number can only go in one place in a row, column, or 3x3 square.
-    :param puzzle: 9x9 Sudoku grid
-    :param puzzle_pos: 9x9 grid of possible values for each cell
+    Counts every digit across a unit at once with SWAR arithmetic on 4-bit lanes, so the
+    sole cell for each such digit is found without scanning the unit per digit.
+    :param puzzle: Flat Sudoku grid
+    :param puzzle_pos: Flat list of candidate bitmasks, kept up to date by place_number
     :return: True if a cell was filled, False otherwise
     """
-    # Row
-    for row in range(9):
-        for num in range(1, 10):
-            positions = [(row, col) for col in range(9) if num in puzzle_pos[row][col]]
-            if len(positions) == 1:
-                puzzle[positions[0][0]][positions[0][1]] = num
-                return True
-    # Column
-    for col in range(9):
-        for num in range(1, 10):
-            positions = [(row, col) for row in range(9) if num in puzzle_pos[row][col]]
-            if len(positions) == 1:
-                puzzle[positions[0][0]][positions[0][1]] = num
-                return True
-    # Square
-    for x in (0, 3, 6):
-        for y in (0, 3, 6):
-            for num in range(1, 10):
-                positions = []
-                for i in range(3):
-                    for j in range(3):
-                        row, col = x + i, y + j
-                        if num in puzzle_pos[row][col]:
-                            positions.append((row, col))
-                if len(positions) == 1:
-                    puzzle[positions[0][0]][positions[0][1]] = num
-                    return True
-    return False
+    filled = False
+    for unit in ALL_UNITS:
+        counts = cells = 0
+        for k, i in enumerate(unit):
+            lanes = LANE_SPREAD[puzzle_pos[i]]
+            # Per-digit count of cells allowing it (at most 9, so lanes never carry)
+            counts += lanes
+            # For a digit allowed in exactly one cell, its lane ends up holding that cell's position
+            cells ^= lanes * k
+        # Flag the lanes where the count is exactly 1 (zero-lane test on counts ^ 1)
+        lane_diff = counts ^ LANE_ONES
+        only = ~(((lane_diff & LANE_LOW_BITS) + LANE_LOW_BITS) | lane_diff) & LANE_HIGH_BITS
+        while only:
+            flag = only & -only
+            only ^= flag
+            shift = flag.bit_length() - 4
+            num = shift // 4 + 1
+            i = unit[(cells >> shift) & 0xF]
+            # An earlier placement in this unit may have filled the same cell
+            if puzzle_pos[i] >> num & 1:
+                place_number(puzzle, puzzle_pos, i, num)
+                filled = True
+    return filled
 
-def find_empty(puzzle: List[List[int]]) -> Optional[Tuple[int, int]]:
+def find_best_empty(puzzle: List[int], row_mask: List[int], col_mask: List[int],
+                    box_mask: List[int]) -> Optional[Tuple[int, int]]:
     """
-    Finds the next empty cell (with value 0) in the puzzle.
-    :param puzzle: 9x9 Sudoku grid
-    :return: Tuple of (row, col) if found, else None
+    Finds the empty cell with the fewest remaining candidates (minimum remaining values).
+    :param puzzle: Flat Sudoku grid
+    :param row_mask: Bitmask of digits used in each row
+    :param col_mask: Bitmask of digits used in each column
+    :param box_mask: Bitmask of digits used in each 3x3 box
+    :return: Tuple of (cell index, candidate mask) if found, else None
     """
-    for i in range(9):
-        for j in range(9):
-            if puzzle[i][j] == 0:
-                return (i, j)
-    return None
+    best = None
+    best_count = 10
+    for i in range(81):
+        if puzzle[i] != 0:
+            continue
+        cand = ~(row_mask[i // 9] | col_mask[i % 9] | box_mask[BOX_OF[i]]) & ALL_CANDIDATES
+        count = cand.bit_count()
+        if count < best_count:
+            best = (i, cand)
+            best_count = count
+            if count <= 1:
+                return best
+    return best
 
-def backtracking(puzzle: List[List[int]]) -> bool:
+def build_masks(puzzle: List[int]) -> Optional[Tuple[List[int], List[int], List[int]]]:
     """
-    Solves the puzzle using recursive backtracking if logic-based methods fail.
-    :param puzzle: 9x9 Sudoku grid
+    Builds row, column, and 3x3 box bitmasks of the digits already placed (bit n set = digit n used).
+    :param puzzle: Flat Sudoku grid
+    :return: Tuple of (row_mask, col_mask, box_mask), or None if two givens conflict
+    """
+    row_mask = [0] * 9
+    col_mask = [0] * 9
+    box_mask = [0] * 9
+    for i in range(81):
+        num = puzzle[i]
+        if num == 0:
+            continue
+        bit = 1 << num
+        row, col, box = i // 9, i % 9, BOX_OF[i]
+        if (row_mask[row] | col_mask[col] | box_mask[box]) & bit:
+            return None
+        row_mask[row] |= bit
+        col_mask[col] |= bit
+        box_mask[box] |= bit
+    return row_mask, col_mask, box_mask
+
+def backtracking(puzzle: List[int]) -> bool:
+    """
+    Solves the puzzle using backtracking if logic-based methods fail.
+    Always branches on the most constrained empty cell. Instead of recursing, keeps an explicit
+    stack of (cell index, untried candidate mask); the unit bitmasks are updated on placement
+    and restored when a cell is revisited.
+    :param puzzle: Flat Sudoku grid
     :return: True if solved, False otherwise
     """
-    empty = find_empty(puzzle)
+    masks = build_masks(puzzle)
+    if masks is None:
+        return False
+    row_mask, col_mask, box_mask = masks
+    empty = find_best_empty(puzzle, row_mask, col_mask, box_mask)
     if not empty:
         return True
-    row, col = empty
-    for num in range(1, 10):
-        if is_possible(puzzle, row, col, num):
-            puzzle[row][col] = num
-            if backtracking(puzzle):
-                return True
-            puzzle[row][col] = 0
+    stack = [empty]
+    while stack:
+        i, cand = stack.pop()
+        row, col, box = i // 9, i % 9, BOX_OF[i]
+        # Undo the previous attempt at this cell, if any
+        num = puzzle[i]
+        if num:
+            bit = 1 << num
+            row_mask[row] ^= bit
+            col_mask[col] ^= bit
+            box_mask[box] ^= bit
+            puzzle[i] = 0
+        if not cand:
+            continue
+        bit = cand & -cand
+        puzzle[i] = bit.bit_length() - 1
+        row_mask[row] |= bit
+        col_mask[col] |= bit
+        box_mask[box] |= bit
+        stack.append((i, cand ^ bit))
+        empty = find_best_empty(puzzle, row_mask, col_mask, box_mask)
+        if not empty:
+            return True
+        stack.append(empty)
     return False
 
-def solve_puzzle(puzzle: List[List[int]], puzzle_pos: List[List[list]]) -> bool:
+def solve_puzzle(puzzle: List[int], puzzle_pos: List[int]) -> bool:
     """
     Attempts to solve the puzzle using logic-based algorithms first, then backtracking if needed.
-    :param puzzle: 9x9 Sudoku grid
-    :param puzzle_pos: 9x9 grid of possible values for each cell
+    Backtracking alone is fastest once there are LOGIC_CLUE_THRESHOLD clues, so the logic
+    passes only run, one sweep each, on sparser puzzles.
+    :param puzzle: Flat Sudoku grid
+    :param puzzle_pos: Flat list, filled with candidate bitmasks for each cell when the logic passes run
     :return: True if solved, False otherwise
     """
-    while True:
-        if row_col_square_single_algo(puzzle, puzzle_pos):
-            continue
-        if row_col_square_only_algo(puzzle, puzzle_pos):
-            continue
-        break
+    if 81 - puzzle.count(0) >= LOGIC_CLUE_THRESHOLD:
+        return backtracking(puzzle)
+    if not fill_candidates(puzzle, puzzle_pos):
+        return False
+    row_col_square_single_algo(puzzle, puzzle_pos)
+    row_col_square_only_algo(puzzle, puzzle_pos)
     if check_puzzle_solved(puzzle):
         return True
     return backtracking(puzzle)
@@ -144,45 +267,36 @@ def solve_puzzle(puzzle: List[List[int]], puzzle_pos: List[List[list]]) -> bool:
 def print_puzzle(puzzle: List[List[int]]):
     """
     Prints the Sudoku puzzle in a formatted grid, matching the output format in the README.
+    The whole grid is written with a single call using PUZZLE_TEMPLATE.
     :param puzzle: 9x9 Sudoku grid
     """
-    for row in range(9):
-        if row % 3 == 0:
-            print('--------------------------')
-        for col in range(9):
-            if col % 3 == 0:
-                print('| ', end="")
-            print(f"{puzzle[row][col]} ", end="")
-        print('|')
+    sys.stdout.write(PUZZLE_TEMPLATE.format(*(num for row in puzzle for num in row)))
 
 def print_minimal_puzzle(puzzle: List[List[int]]):
     """
     Prints the puzzle as a single string of digits per row (minimal format).
     :param puzzle: 9x9 Sudoku grid
     """
-    for row in puzzle:
-        print(''.join(str(num) for num in row))
+    sys.stdout.write(''.join(''.join(str(num) for num in row) + '\n' for row in puzzle))
 
-def load_puzzles_from_file(filename: str):
+def load_puzzles_from_file(filename: str) -> Iterator[Tuple[str, bytearray]]:
     """
-    Loads puzzles from a text file in the expected format.
+    Loads puzzles from a text file in the expected format, one at a time as the file is read.
     :param filename: Path to the puzzle file
-    :return: List of (puzzle_name, puzzle_grid) tuples
+    :return: Generator of (puzzle_name, puzzle_grid) tuples, each grid a flat bytearray of cell values
     """
     with open(filename, "r") as puzzle_file:
-        puzzles = []
-        puzzle = []
+        puzzle = bytearray()
         puzzle_name = ''
         for line in puzzle_file:
             if 'Grid' in line:
                 if puzzle:
-                    puzzles.append((puzzle_name, puzzle))
-                    puzzle = []
+                    yield puzzle_name, puzzle
+                    puzzle = bytearray()
                 puzzle_name = line.strip()
             else:
-                row = [int(num) for num in line.strip() if num.isdigit()]
+                row = parse_puzzle_row(line)
                 if row:
-                    puzzle.append(row)
+                    puzzle += row
         if puzzle:
-            puzzles.append((puzzle_name, puzzle))
-    return puzzles
\ No newline at end of file
+            yield puzzle_name, puzzle
@@ -0,0 +1,162 @@
+# PySudoku Solver - Dancing Links Solver
+# --------------------------------------
+# Solves Sudoku as an exact cover problem with Knuth's Algorithm X over dancing links.
+# The 729-row x 324-column cover matrix is built once at import; each solve works on a copy of its link arrays.
+#
+# Author: thejonali (https://github.com/thejonali)
+# License: Apache 2.0
+
+from typing import List
+
+# Column layout of the cover matrix (column 0 is the root header)
+CELL_COLS = 1        # 81 columns: cell (r, c) is filled
+ROW_DIGIT_COLS = 82  # 81 columns: row r contains digit d
+COL_DIGIT_COLS = 163 # 81 columns: column c contains digit d
+BOX_DIGIT_COLS = 244 # 81 columns: box b contains digit d
+NUM_COLS = 324
+
+def _candidate_columns(row: int, col: int, digit: int) -> List[int]:
+    """
+    Returns the four constraint columns covered by placing digit (1-9) at (row, col).
+    """
+    box = (row // 3) * 3 + col // 3
+    return [
+        CELL_COLS + row * 9 + col,
+        ROW_DIGIT_COLS + row * 9 + digit - 1,
+        COL_DIGIT_COLS + col * 9 + digit - 1,
+        BOX_DIGIT_COLS + box * 9 + digit - 1,
+    ]
+
+def _build_links():
+    """
+    Builds the toroidal doubly-linked cover matrix as flat index arrays.
+    Nodes 0..324 are the root and column headers; each of the 729 candidates then owns 4 nodes.
+    :return: Tuple of (L, R, U, D, C, S, ROW) lists
+    """
+    size = NUM_COLS + 1 + 729 * 4
+    L = [0] * size
+    R = [0] * size
+    U = list(range(size))
+    D = list(range(size))
+    C = [0] * size
+    S = [0] * (NUM_COLS + 1)
+    ROW = [-1] * size
+    for i in range(NUM_COLS + 1):
+        L[i] = i - 1 if i > 0 else NUM_COLS
+        R[i] = i + 1 if i < NUM_COLS else 0
+        C[i] = i
+    node = NUM_COLS + 1
+    for row in range(9):
+        for col in range(9):
+            for digit in range(1, 10):
+                first = node
+                for column in _candidate_columns(row, col, digit):
+                    C[node] = column
+                    ROW[node] = (row * 9 + col) * 9 + digit - 1
+                    U[node] = U[column]
+                    D[node] = column
+                    D[U[column]] = node
+                    U[column] = node
+                    S[column] += 1
+                    L[node] = node - 1
+                    R[node] = node + 1
+                    node += 1
+                L[first] = node - 1
+                R[node - 1] = first
+    return L, R, U, D, C, S, ROW
+
+_LINKS = _build_links()
+
+def _cover(c: int, L: List[int], R: List[int], U: List[int], D: List[int], C: List[int], S: List[int]):
+    """
+    Removes column c from the header list and every row that uses it from the other columns.
+    """
+    R[L[c]] = R[c]
+    L[R[c]] = L[c]
+    i = D[c]
+    while i != c:
+        j = R[i]
+        while j != i:
+            U[D[j]] = U[j]
+            D[U[j]] = D[j]
+            S[C[j]] -= 1
+            j = R[j]
+        i = D[i]
+
+def _uncover(c: int, L: List[int], R: List[int], U: List[int], D: List[int], C: List[int], S: List[int]):
+    """
+    Exact inverse of _cover, restoring links in reverse order.
+    """
+    i = U[c]
+    while i != c:
+        j = L[i]
+        while j != i:
+            S[C[j]] += 1
+            U[D[j]] = j
+            D[U[j]] = j
+            j = L[j]
+        i = U[i]
+    R[L[c]] = c
+    L[R[c]] = c
+
+def _search(links, solution: List[int]) -> bool:
+    """
+    Algorithm X: branches on the column with the fewest remaining rows.
+    Appends the chosen candidate rows to solution.
+    """
+    L, R, U, D, C, S, ROW = links
+    if R[0] == 0:
+        return True
+    c = R[0]
+    best = S[c]
+    j = R[c]
+    while j != 0 and best > 1:
+        if S[j] < best:
+            c = j
+            best = S[j]
+        j = R[j]
+    if best == 0:
+        return False
+    _cover(c, L, R, U, D, C, S)
+    r = D[c]
+    while r != c:
+        solution.append(ROW[r])
+        j = R[r]
+        while j != r:
+            _cover(C[j], L, R, U, D, C, S)
+            j = R[j]
+        if _search(links, solution):
+            return True
+        j = L[r]
+        while j != r:
+            _uncover(C[j], L, R, U, D, C, S)
+            j = L[j]
+        solution.pop()
+        r = D[r]
+    _uncover(c, L, R, U, D, C, S)
+    return False
+
+def solve_dlx(puzzle: List[int]) -> bool:
+    """
+    Solves the puzzle in place using dancing links.
+    :param puzzle: Flat Sudoku grid (81 ints, row-major)
+    :return: True if solved, False otherwise (the grid is left unchanged)
+    """
+    L, R, U, D, C, S, ROW = links = tuple(list(a) for a in _LINKS)
+    covered = bytearray(NUM_COLS + 1)
+    for i in range(81):
+        digit = puzzle[i]
+        if digit == 0:
+            continue
+        for column in _candidate_columns(i // 9, i % 9, digit):
+            if covered[column]:
+                return False
+            covered[column] = 1
+            _cover(column, L, R, U, D, C, S)
+    solution = []
+    if not _search(links, solution):
+        return False
+    for candidate in solution:
+        cell, digit = divmod(candidate, 9)
+        puzzle[cell] = digit + 1
+    return True
@@ -6,50 +6,71 @@
 # Author: thejonali (https://github.com/thejonali)
 # License: Apache 2.0
 
-from typing import List
+from typing import List, Optional
 
-def parse_puzzle_string(puzzle_str: str) -> List[List[int]]:
+# Characters accepted in puzzle strings: '1'-'9' as knowns, '0', '.', 'x', 'X' as unknowns
+VALID_CHARS = b'0123456789.xX'
+# Deleting these bytes from a line leaves only puzzle characters
+NON_PUZZLE_CHARS = bytes(c for c in range(256) if c not in VALID_CHARS)
+
+# bytes.translate tables, each a single C-level pass over the data:
+# puzzle characters to cell values (blanks become 0)
+CHAR_TO_VALUE = bytes.maketrans(VALID_CHARS, bytes(range(10)) + bytes(3))
+# cell values to characters: 0-9 map to '0'-'9', anything else to '0'
+VALUE_TO_CHAR = b'0123456789' + b'0' * 246
+# any character to itself if it is '1'-'9', otherwise to '0'
+CHAR_TO_DIGIT_CHAR = bytes(c if 0x31 <= c <= 0x39 else 0x30 for c in range(256))
+
+def is_puzzle_string(puzzle_str: str) -> bool:
     """
-    Parses a string of 81 characters into a 9x9 Sudoku grid.
+    Returns True if the string is exactly 81 valid puzzle characters.
+    """
+    return len(puzzle_str) == 81 and not puzzle_str.encode('ascii', 'replace').translate(None, VALID_CHARS)
+
+def parse_puzzle_bytes(puzzle_str: str) -> bytearray:
+    """
+    Parses a string of 81 characters into a flat bytearray of cell values (row-major, 0 for unknowns).
     Accepts '0', '.', 'x', or 'X' as unknowns, '1'-'9' as knowns.
     Raises ValueError if the string is not valid.
     """
     puzzle_str = puzzle_str.strip().replace('\n', '')
     if len(puzzle_str) != 81:
         raise ValueError("Puzzle string must be exactly 81 characters.")
-    grid = []
-    for i in range(9):
-        row = []
-        for j in range(9):
-            c = puzzle_str[i * 9 + j]
-            if c in '0.xX':
-                row.append(0)
-            elif c in '123456789':
-                row.append(int(c))
-            else:
-                raise ValueError(f"Invalid character '{c}' in puzzle string.")
-        grid.append(row)
-    return grid
+    # Non-ASCII characters become '?' so they are reported as invalid below
+    data = puzzle_str.encode('ascii', 'replace')
+    if data.translate(None, VALID_CHARS):
+        c = next(c for c in puzzle_str if c not in VALID_CHARS.decode('ascii'))
+        raise ValueError(f"Invalid character '{c}' in puzzle string.")
+    return bytearray(data.translate(CHAR_TO_VALUE))
+
+def parse_puzzle_row(line: str) -> Optional[bytes]:
+    """
+    Parses one line of a puzzle file into the 9 cell values of a row.
+    Returns None if the line does not hold exactly 9 puzzle characters (e.g. a header or comment line).
+    """
+    values = line.encode('ascii', 'ignore').translate(CHAR_TO_VALUE, NON_PUZZLE_CHARS)
+    return values if len(values) == 9 else None
+
+def parse_puzzle_string(puzzle_str: str) -> List[List[int]]:
+    """
+    Parses a string of 81 characters into a 9x9 Sudoku grid.
+    Accepts '0', '.', 'x', or 'X' as unknowns, '1'-'9' as knowns.
+    Raises ValueError if the string is not valid.
+    """
+    values = parse_puzzle_bytes(puzzle_str)
+    return [list(values[i:i + 9]) for i in range(0, 81, 9)]
 
 def puzzle_grid_to_string(grid: List[List[int]]) -> str:
     """
     Converts a 9x9 Sudoku grid to a string of 81 characters (0 for empty).
     """
-    chars = []
-    for i in range(9):
-        for j in range(9):
-            val = grid[i][j]
-            chars.append(str(val) if val in range(1, 10) else "0")
-    return ''.join(chars)
+    # Values outside 0-9 (including negatives and values above 255, which bytes() rejects) become 0
+    return bytes(val if 0 <= val <= 9 else 0 for row in grid for val in row).translate(VALUE_TO_CHAR).decode('ascii')
 
 def get_puzzle_string_from_cells(cells) -> str:
     """
     Given a 9x9 list of QLineEdit cells, returns a string of 81 chars (0 for empty).
     """
-    chars = []
-    for row in cells:
-        for cell in row:
-            val = cell.text().strip()
-            # Always append "0" if the cell is empty or not a digit 1-9
-            chars.append("0" if not val or val not in "123456789" else val)
-    return ''.join(chars)
+    # Empty cells read as "0"; anything that is not a digit 1-9 is mapped to "0" by the table
+    text = ''.join(cell.text().strip()[:1] or '0' for row in cells for cell in row)
+    return text.encode('ascii', 'replace').translate(CHAR_TO_DIGIT_CHAR).decode('ascii')
@@ -10,10 +10,47 @@ from PyQt5.QtWidgets import (
     QMenuBar, QMenu, QAction, QFileDialog, QMessageBox, QActionGroup
 )
 from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPalette, QPen
 import sys
 import solver
+from algorithms import check_puzzle_valid
+from functions import VALUE_TO_CHAR
 from puzzle import SudokuPuzzle
 
+class SudokuGridWidget(QWidget):
+    """
+    Container for the 81 cell editors. Paints the cell backgrounds and borders itself from
+    cached brushes, so the transparent QLineEdits on top need no per-cell stylesheet.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cells = []
+        self._brushes = None
+        self._border_pen = None
+
+    def set_brushes(self, brushes, border_pen):
+        """
+        Set the (white, black) background brushes and border pen, then repaint.
+        """
+        self._brushes = brushes
+        self._border_pen = border_pen
+        self.update()
+
+    def paintEvent(self, event):
+        """
+        Fill each cell's rectangle with its box color and draw its border.
+        """
+        if self._brushes is None:
+            return
+        painter = QPainter(self)
+        painter.setPen(self._border_pen)
+        for i, row in enumerate(self.cells):
+            for j, cell in enumerate(row):
+                rect = cell.geometry()
+                painter.fillRect(rect, self._brushes[(i // 3 + j // 3) % 2])
+                painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        painter.end()
+
 class SudokuUI(QWidget):
     """
     Main Sudoku GUI class. Handles grid display, user input, theming, file loading, and puzzle solving.
@@ -28,28 +65,45 @@ class SudokuUI(QWidget):
         self.elapsed_seconds = 0
         self.theme = "Panda"
         self.puzzle = SudokuPuzzle()
+        # Cell colors as (background, text) for white and black boxes, plus the border color
         self.themes = {
             "Panda": {
-                "white": "background: #eee; color: black;",
-                "black": "background: #222; color: white;",
-                "border": "1px solid #888"
+                "white": ("#eee", "black"),
+                "black": ("#222", "white"),
+                "border": "#888"
             },
             "Ocean": {
-                "white": "background: #b3e0ff; color: #00334d;",
-                "black": "background: #005073; color: #b3e0ff;",
-                "border": "1px solid #005073"
+                "white": ("#b3e0ff", "#00334d"),
+                "black": ("#005073", "#b3e0ff"),
+                "border": "#005073"
             },
             "Forest": {
-                "white": "background: #e6ffe6; color: #003300;",
-                "black": "background: #336633; color: #e6ffe6;",
-                "border": "1px solid #336633"
+                "white": ("#e6ffe6", "#003300"),
+                "black": ("#336633", "#e6ffe6"),
+                "border": "#336633"
             },
             "Sunset": {
-                "white": "background: #fff0e6; color: #b34700;",
-                "black": "background: #ff944d; color: #fff0e6;",
-                "border": "1px solid #b34700"
+                "white": ("#fff0e6", "#b34700"),
+                "black": ("#ff944d", "#fff0e6"),
+                "border": "#b34700"
             }
         }
+        # Brushes, border pen, and text palettes per theme, built once and reused on every switch
+        self._theme_paint = {}
+        for name, theme in self.themes.items():
+            brushes = []
+            palettes = []
+            for key in ("white", "black"):
+                background, text = theme[key]
+                brushes.append(QBrush(QColor(background)))
+                palette = QPalette()
+                palette.setColor(QPalette.Base, Qt.transparent)
+                palette.setColor(QPalette.Text, QColor(text))
+                palettes.append(palette)
+            self._theme_paint[name] = (tuple(brushes), QPen(QColor(theme["border"])), tuple(palettes))
+        self._applied_theme = None
+        # Cell values (0 for empty), kept in sync with the QLineEdits by _on_cell_changed
+        self._cell_values = bytearray(81)
         self.init_ui()
         if puzzle_str:
             self.set_puzzle_from_string(puzzle_str)
@@ -103,8 +157,10 @@ class SudokuUI(QWidget):
         self.timer.timeout.connect(self.update_timer)
 
         # --- Sudoku Grid ---
-        self.grid_layout = QGridLayout()
-        self.cells = []
+        self.grid_widget = SudokuGridWidget()
+        self.grid_layout = QGridLayout(self.grid_widget)
+        self.grid_layout.setContentsMargins(0, 0, 0, 0)
+        self.cells = self.grid_widget.cells
         for i in range(9):
             row_cells = []
             for j in range(9):
@@ -112,10 +168,15 @@ class SudokuUI(QWidget):
                 cell.setFixedSize(32, 32)
                 cell.setMaxLength(1)
                 cell.setAlignment(Qt.AlignCenter)
+                cell.setFrame(False)
+                font = cell.font()
+                font.setPixelSize(18)
+                cell.setFont(font)
+                cell.textChanged.connect(lambda text, idx=i * 9 + j: self._on_cell_changed(idx, text))
                 row_cells.append(cell)
                 self.grid_layout.addWidget(cell, i, j)
             self.cells.append(row_cells)
-        main_layout.addLayout(self.grid_layout)
+        main_layout.addWidget(self.grid_widget)
         self.apply_theme(self.theme)
 
         # --- Control Buttons ---
@@ -140,17 +201,16 @@ class SudokuUI(QWidget):
     def apply_theme(self, theme_name):
         """
         Apply the selected theme to the Sudoku grid.
+        The grid widget paints backgrounds from the theme's cached brushes; cells only get a cached text palette.
         """
-        theme = self.themes[theme_name]
-        for i in range(9):
-            for j in range(9):
-                cell = self.cells[i][j]
-                # Each property must be separated by a semicolon, and border must be a valid CSS border property
-                if ((i // 3 + j // 3) % 2 == 0):
-                    style = f"font-size: 18px; border: {theme['border']}; {theme['white']}"
-                else:
-                    style = f"font-size: 18px; border: {theme['border']}; {theme['black']}"
-                cell.setStyleSheet(style)
+        if theme_name == self._applied_theme:
+            return
+        brushes, border_pen, palettes = self._theme_paint[theme_name]
+        self.grid_widget.set_brushes(brushes, border_pen)
+        for i, row in enumerate(self.cells):
+            for j, cell in enumerate(row):
+                cell.setPalette(palettes[(i // 3 + j // 3) % 2])
+        self._applied_theme = theme_name
 
     def set_theme(self, theme_name):
         """
@@ -183,13 +243,9 @@ class SudokuUI(QWidget):
             self.timer.start(1000)
             self.timer_running = True
             self.start_btn.setText("Pause")
-            for row in self.cells:
-                for cell in row:
-                    val = cell.text().strip()
-                    if val and val in "123456789":
-                        cell.setReadOnly(True)
-                    else:
-                        cell.setReadOnly(False)
+            for i, row in enumerate(self.cells):
+                for j, cell in enumerate(row):
+                    cell.setReadOnly(self._cell_values[i * 9 + j] != 0)
         else:
             self.timer.stop()
             self.timer_running = False
@@ -208,11 +264,17 @@ class SudokuUI(QWidget):
         """
         Clears all cells in the grid and resets the window title and timer.
         Also unlocks all cells.
+        Repaints and cell signals are suspended until all 81 cells are cleared.
         """
+        self.setUpdatesEnabled(False)
         for row in self.cells:
             for cell in row:
+                cell.blockSignals(True)
                 cell.clear()
                 cell.setReadOnly(False)
+                cell.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self._cell_values[:] = bytes(81)
         self.setWindowTitle("PySudoku Solver")
         self.timer.stop()
         self.timer_running = False
@@ -224,31 +286,27 @@ class SudokuUI(QWidget):
     def get_puzzle_string(self):
         """
         Returns the current grid as a string of 81 chars (0 for empty).
-        Uses the puzzle object for consistency.
+        Reads the cached cell values and updates the puzzle object for consistency.
         """
         # Update puzzle object from UI before returning string
-        grid = []
-        for i in range(9):
-            row = []
-            for j in range(9):
-                val = self.cells[i][j].text().strip()
-                if val and val in "123456789":
-                    row.append(int(val))
-                else:
-                    row.append(0)
-            grid.append(row)
-        self.puzzle.set_grid(grid)
-        return self.puzzle.to_string()
+        self.puzzle.set_grid_inplace(bytearray(self._cell_values))
+        return self._cell_values.translate(VALUE_TO_CHAR).decode('ascii')
 
     def set_puzzle_from_grid(self, grid):
         """
         Sets the UI grid from a 9x9 list of lists and updates the puzzle object.
+        Repaints and cell signals are suspended until all 81 cells are set.
         """
         self.puzzle.set_grid(grid)
+        self.setUpdatesEnabled(False)
         for i in range(9):
             for j in range(9):
-                val = str(grid[i][j]) if grid[i][j] != 0 else ""
-                self.cells[i][j].setText(val)
+                cell = self.cells[i][j]
+                cell.blockSignals(True)
+                cell.setText(str(grid[i][j]) if grid[i][j] != 0 else "")
+                cell.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self._cell_values[:] = self.puzzle.grid
 
     def set_puzzle_from_string(self, puzzle_str):
         """
@@ -262,8 +320,7 @@ class SudokuUI(QWidget):
         Calls the solver and animates the solution if successful.
         """
         self.setWindowTitle("PySudoku Solver - Solving...")
-        puzzle_str = self.get_puzzle_string()
-        self.puzzle.set_from_string(puzzle_str)
+        self.get_puzzle_string()  # Syncs the puzzle object with the cached cell values
         grid = solver.solve_puzzle_obj(self.puzzle)
         if grid and len(grid) == 9 and all(len(row) == 9 for row in grid):
             self.animate_solution(grid)
@@ -275,25 +332,23 @@ class SudokuUI(QWidget):
         Animate filling the grid with the solution within 1 second.
         """
         self._anim_i = 0
-        self._anim_j = 0
         self._anim_grid = grid
         self._anim_timer = QTimer(self)
         self._anim_timer.timeout.connect(self._animate_step)
-        self._anim_timer.start(12)  # ~12ms per cell for 81 cells in 1s
+        self._anim_timer.start(110)  # one row of 9 cells per ~110ms tick, 9 rows in 1s
 
     def _animate_step(self):
         """
-        Animation step: fill one cell per timer tick.
+        Animation step: fill one row of cells per timer tick, repainting once per row.
         When finished, check if the puzzle is solved and show the time.
         """
-        i, j = self._anim_i, self._anim_j
-        val = str(self._anim_grid[i][j]) if self._anim_grid[i][j] != 0 else ""
-        self.cells[i][j].setText(val)
-        if j < 8:
-            self._anim_j += 1
-        else:
-            self._anim_j = 0
-            self._anim_i += 1
+        i = self._anim_i
+        self.setUpdatesEnabled(False)
+        for j in range(9):
+            val = str(self._anim_grid[i][j]) if self._anim_grid[i][j] != 0 else ""
+            self.cells[i][j].setText(val)
+        self.setUpdatesEnabled(True)
+        self._anim_i += 1
         if self._anim_i > 8:
             self._anim_timer.stop()
             if self.timer_running:
@@ -308,31 +363,18 @@ class SudokuUI(QWidget):
                 self.setWindowTitle("PySudoku Solver - Filled (Not Solved)")
             self.start_btn.setEnabled(False)
 
+    def _on_cell_changed(self, index, text):
+        """
+        Slot for a cell's textChanged signal: stores its value (0 unless a digit 1-9) in the cache.
+        """
+        val = text.strip()
+        self._cell_values[index] = int(val) if val and val in "123456789" else 0
+
     def is_puzzle_solved(self):
         """
         Checks if the current grid is a valid, completely filled Sudoku solution.
         """
-        grid = []
-        for i in range(9):
-            row = []
-            for j in range(9):
-                val = self.cells[i][j].text().strip()
-                if val in "123456789":
-                    row.append(int(val))
-                else:
-                    return False
-            grid.append(row)
-        for i in range(9):
-            if len(set(grid[i])) != 9:
-                return False
-            if len(set(grid[j][i] for j in range(9))) != 9:
-                return False
-        for bi in range(0, 9, 3):
-            for bj in range(0, 9, 3):
-                block = [grid[bi + x][bj + y] for x in range(3) for y in range(3)]
-                if len(set(block)) != 9:
-                    return False
-        return True
+        return check_puzzle_valid(self._cell_values)
 
 def main():
     """
@@ -1,4 +1,5 @@
 from typing import List, Optional, Tuple, Any
+from functions import parse_puzzle_bytes, parse_puzzle_row, VALUE_TO_CHAR
 
 class PuzzleBase:
     """
@@ -10,6 +11,12 @@ class PuzzleBase:
     def set_grid(self, grid: List[List[int]]) -> None:
         raise NotImplementedError
 
+    def get_grid_view(self) -> bytearray:
+        raise NotImplementedError
+
+    def set_grid_inplace(self, grid: bytearray) -> None:
+        raise NotImplementedError
+
     def set_from_string(self, puzzle_str: str) -> None:
         raise NotImplementedError
 
@@ -22,9 +29,10 @@ class PuzzleBase:
 class SudokuPuzzle(PuzzleBase):
     """
     Concrete implementation of a 9x9 Sudoku puzzle.
+    The grid is stored as a flat bytearray of 81 cells (row-major, 0 for blanks).
     """
     def __init__(self, grid: Optional[List[List[int]]] = None):
-        self.grid = [[0 for _ in range(9)] for _ in range(9)]
+        self.grid = bytearray(81)
         if grid:
             self.set_grid(grid)
 
@@ -32,7 +40,7 @@ class SudokuPuzzle(PuzzleBase):
         """
         Returns the current puzzle grid.
         """
-        return [row[:] for row in self.grid]
+        return [list(self.grid[i:i + 9]) for i in range(0, 81, 9)]
 
     def set_grid(self, grid: List[List[int]]) -> None:
         """
@@ -40,51 +48,49 @@ class SudokuPuzzle(PuzzleBase):
         """
         if len(grid) != 9 or any(len(row) != 9 for row in grid):
             raise ValueError("Grid must be 9x9.")
-        self.grid = [row[:] for row in grid]
+        self.grid = bytearray(num for row in grid for num in row)
+
+    def get_grid_view(self) -> bytearray:
+        """
+        Returns the flat 81-cell grid itself, without copying.
+        Changes made through it (e.g. by the solver, which works in place) change the puzzle.
+        """
+        return self.grid
+
+    def set_grid_inplace(self, grid: bytearray) -> None:
+        """
+        Uses the given flat 81-cell bytearray as the puzzle grid, without copying.
+        """
+        if len(grid) != 81:
+            raise ValueError("Grid must have 81 cells.")
+        self.grid = grid
 
     def set_from_string(self, puzzle_str: str) -> None:
         """
         Sets the puzzle grid from a string of 81 characters.
         Accepts 0, ., x, X as blanks.
         """
-        puzzle_str = puzzle_str.strip().replace('\n', '')
-        if len(puzzle_str) != 81:
-            raise ValueError("Puzzle string must be exactly 81 characters.")
-        grid = []
-        for i in range(9):
-            row = []
-            for j in range(9):
-                c = puzzle_str[i * 9 + j]
-                if c in '0.xX':
-                    row.append(0)
-                elif c in '123456789':
-                    row.append(int(c))
-                else:
-                    raise ValueError(f"Invalid character '{c}' in puzzle string.")
-            grid.append(row)
-        self.set_grid(grid)
+        self.grid = parse_puzzle_bytes(puzzle_str)
 
     def set_from_file(self, filename: str) -> None:
         """
         Loads the first puzzle from a file and sets the grid.
         """
+        # Read line by line until the first 9 lines of 9 digits are found
+        grid = bytearray()
         with open(filename, "r") as f:
-            lines = [line.strip() for line in f if line.strip()]
-        # Try to find the first 9 lines of digits
-        puzzle_lines = []
-        for line in lines:
-            digits = [int(c) if c in "123456789" else 0 for c in line if c in "1234567890.xX"]
-            if len(digits) == 9:
-                puzzle_lines.append(digits)
-            if len(puzzle_lines) == 9:
-                break
-        if len(puzzle_lines) != 9:
+            for line in f:
+                row = parse_puzzle_row(line)
+                if row:
+                    grid += row
+                    if len(grid) == 81:
+                        break
+        if len(grid) != 81:
             raise ValueError("Could not find a valid 9x9 puzzle in file.")
-        self.set_grid(puzzle_lines)
+        self.set_grid_inplace(grid)
 
     def to_string(self) -> str:
         """
         Returns the puzzle as a string of 81 characters (0 for blanks).
         """
-        return ''.join(str(self.grid[i][j]) if self.grid[i][j] != 0 else '0'
-                       for i in range(9) for j in range(9))
+        return self.grid.translate(VALUE_TO_CHAR).decode('ascii')
@@ -0,0 +1,16 @@
+# PySudoku Solver - C Extension Build
+# -----------------------------------
+# Builds the optional _sudoku_c solver core next to the sources:
+#   python setup.py build_ext --inplace
+# The solver falls back to Numba or pure Python when the extension is not built.
+#
+# Author: thejonali (https://github.com/thejonali)
+# License: Apache 2.0
+
+from setuptools import setup, Extension
+
+setup(
+    name="pysudoku-solver",
+    py_modules=[],
+    ext_modules=[Extension("_sudoku_c", ["_sudoku_c.c"])],
+)
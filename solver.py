@@ -1,61 +1,103 @@
 # PySudoku Solver - Command Line Interface
 # ----------------------------------------
 # A command-line Sudoku puzzle solver that can solve puzzles from a text file or from a string passed as an argument.
-# Uses logic-based techniques and backtracking, with solving logic separated into algorithms.py for modularity.
+# Uses a compiled bitmask core (C extension or Numba) or dancing links by default, with the logic-based
+# techniques and backtracking in algorithms.py available via --legacy-solve.
 # Prints solved puzzles in a formatted grid. Designed for extensibility and future UI integration.
 #
 # Author: thejonali (https://github.com/thejonali)
 # License: Apache 2.0
 
 import sys
+import warnings
 from algorithms import (
     solve_puzzle,
     print_puzzle,
     load_puzzles_from_file,
 )
-from functions import parse_puzzle_string
+from dlx import solve_dlx
+from functions import is_puzzle_string
 from puzzle import SudokuPuzzle
 
-def solve_puzzle_obj(puzzle_obj: SudokuPuzzle):
+# Pick the fastest available core: the C extension, then Numba, then pure Python dancing links.
+# solver_core is only imported without the C extension, so one-shot runs skip Numba's startup cost.
+try:
+    import _sudoku_c
+    solve_array = None
+except ImportError:
+    _sudoku_c = None
+    try:
+        from solver_core import NUMBA_AVAILABLE, solve_array
+    except ImportError:
+        # solver_core needs NumPy; without it there is no compiled core either
+        NUMBA_AVAILABLE = False
+    if not NUMBA_AVAILABLE:
+        solve_array = None
+        warnings.warn(
+            "Neither the _sudoku_c extension nor Numba is available; using the pure Python solver. "
+            "Build the extension with 'python setup.py build_ext --inplace' or install numba for faster solving.",
+            RuntimeWarning,
+        )
+
+def solve_puzzle_obj(puzzle_obj: SudokuPuzzle, legacy: bool = False):
     """
     Solves a SudokuPuzzle object and returns the solved grid (list of lists) or None if failed.
+    Uses the C extension or the Numba-compiled core when available, otherwise the dancing links solver.
+    With legacy=True, uses the logic-based algorithms followed by backtracking instead.
     """
-    from algorithms import solve_puzzle
-    grid = puzzle_obj.get_grid()
-    puzzle_pos = [[[] for _ in range(9)] for _ in range(9)]
-    solved = solve_puzzle(grid, puzzle_pos)
+    # Solve directly on the puzzle's flat bytearray instead of copying it out and back
+    grid = puzzle_obj.get_grid_view()
+    if legacy:
+        original = bytes(grid)
+        solved = solve_puzzle(grid, [0] * 81)
+        if not solved:
+            # The logic passes may have filled cells before backtracking failed
+            grid[:] = original
+    elif _sudoku_c is not None:
+        solution = _sudoku_c.solve(grid)
+        solved = solution is not None
+        if solved:
+            grid[:] = solution
+    elif solve_array is not None:
+        solved = solve_array(grid)
+    else:
+        solved = solve_dlx(grid)
     if solved:
-        puzzle_obj.set_grid(grid)
-        return grid
+        return puzzle_obj.get_grid()
     return None
 
-def solve(puzzle_str: str):
+def solve(puzzle_str: str, legacy: bool = False):
     """
     Solves a puzzle from a string of 81 chars and returns the solved grid (list of lists) or None if failed.
     """
     puzzle = SudokuPuzzle()
     puzzle.set_from_string(puzzle_str)
-    return solve_puzzle_obj(puzzle)
+    return solve_puzzle_obj(puzzle, legacy)
 
 def main():
     """
     Main entry point: solves a puzzle from a string of 81 characters or from a file.
     Prints usage instructions if no argument is provided.
+    Pass --legacy-solve to use the logic-based algorithms with backtracking.
     """
-    if len(sys.argv) <= 1:
+    args = sys.argv[1:]
+    legacy = '--legacy-solve' in args
+    args = [a for a in args if a != '--legacy-solve']
+    if not args:
         print(
             "Please provide an 81 character string (digits 1-9, 0, ., x, or X for blanks),\n"
             "or provide the location of a file containing puzzle(s).\n"
             "Examples:\n"
             "  python solver.py 530070000600195000098000060800060003400803001700020006060000280000419005000080079\n"
-            "  python solver.py puzzles/puzzles.txt"
+            "  python solver.py puzzles/puzzles.txt\n"
+            "Add --legacy-solve to use the logic-based algorithms with backtracking."
         )
         return
 
-    arg = sys.argv[1].strip()
+    arg = args[0].strip()
     is_file = (
         '.' in arg and len(arg.split('.')[-1]) > 0 and
-        not (len(arg) == 81 and all(c in '1234567890.xX' for c in arg))
+        not is_puzzle_string(arg)
     )
     if is_file:
         filename = arg
@@ -63,8 +105,8 @@ def main():
         puzzles = load_puzzles_from_file(filename)
         for puzzle_name, puzzle_grid in puzzles:
             puzzle_obj = SudokuPuzzle()
-            puzzle_obj.set_grid(puzzle_grid)
-            solved_grid = solve_puzzle_obj(puzzle_obj)
+            puzzle_obj.set_grid_inplace(puzzle_grid)
+            solved_grid = solve_puzzle_obj(puzzle_obj, legacy)
             print(puzzle_name)
             if not solved_grid:
                 failed_count += 1
@@ -75,12 +117,12 @@ def main():
         print(f"Failed {failed_count}")
     else:
         puzzle_str = arg.replace('\n', '')
-        if len(puzzle_str) != 81 or not all(c in '1234567890.xX' for c in puzzle_str):
+        if not is_puzzle_string(puzzle_str):
             print('Input must be a string of exactly 81 characters (digits 1-9, 0, ., x, or X for blanks).')
             return
         puzzle_obj = SudokuPuzzle()
         puzzle_obj.set_from_string(puzzle_str)
-        solved_grid = solve_puzzle_obj(puzzle_obj)
+        solved_grid = solve_puzzle_obj(puzzle_obj, legacy)
         if not solved_grid:
             print('Failed!')
         else:
@@ -0,0 +1,148 @@
+# PySudoku Solver - Compiled Solver Core
+# --------------------------------------
+# Numba-compiled bitmask backtracking on a NumPy int8 grid, used by the CLI and GUI when Numba is installed.
+# Strings never enter the compiled region: puzzles are parsed in Python and passed in as arrays.
+#
+# Author: thejonali (https://github.com/thejonali)
+# License: Apache 2.0
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit when Numba is not installed; returns functions unchanged.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Bits 1-9 set: every digit is still a candidate
+ALL_CANDIDATES = 0x3FE
+
+@njit(cache=True)
+def _popcount(mask):
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+@njit(cache=True)
+def init_masks(grid, row, col, box):
+    """
+    Fills the row, column, and box bitmasks from the givens in grid.
+    :param grid: np.int8[9, 9] Sudoku grid (0 for empty)
+    :param row: np.int32[9] row masks, zeroed
+    :param col: np.int32[9] column masks, zeroed
+    :param box: np.int32[9] box masks, zeroed
+    :return: False if two givens conflict, True otherwise
+    """
+    for r in range(9):
+        for c in range(9):
+            num = grid[r, c]
+            if num == 0:
+                continue
+            bit = 1 << num
+            b = (r // 3) * 3 + c // 3
+            if (row[r] | col[c] | box[b]) & bit:
+                return False
+            row[r] |= bit
+            col[c] |= bit
+            box[b] |= bit
+    return True
+
+@njit(cache=True)
+def _pick_cell(grid, row, col, box):
+    """
+    Returns (flat index, candidate mask) of the empty cell with the fewest candidates,
+    or (-1, 0) if the grid is full.
+    """
+    best = -1
+    best_cand = 0
+    best_count = 10
+    for r in range(9):
+        for c in range(9):
+            if grid[r, c] != 0:
+                continue
+            cand = ~(row[r] | col[c] | box[(r // 3) * 3 + c // 3]) & ALL_CANDIDATES
+            count = _popcount(cand)
+            if count < best_count:
+                best = r * 9 + c
+                best_cand = cand
+                best_count = count
+                if count <= 1:
+                    return best, best_cand
+    return best, best_cand
+
+@njit(cache=True)
+def solve_nb(grid, row, col, box):
+    """
+    Solves grid in place with MRV bitmask backtracking, using an explicit stack of
+    (cell, remaining candidates) instead of recursion.
+    :param grid: np.int8[9, 9] Sudoku grid (0 for empty)
+    :param row: np.int32[9] row masks built by init_masks
+    :param col: np.int32[9] column masks built by init_masks
+    :param box: np.int32[9] box masks built by init_masks
+    :return: True if solved, False otherwise (grid and masks are restored)
+    """
+    stack_cell = np.empty(81, np.int32)
+    stack_cand = np.empty(81, np.int32)
+    cell, cand = _pick_cell(grid, row, col, box)
+    if cell < 0:
+        return True
+    depth = 0
+    stack_cell[0] = cell
+    stack_cand[0] = cand
+    while depth >= 0:
+        cell = stack_cell[depth]
+        r = cell // 9
+        c = cell % 9
+        b = (r // 3) * 3 + c // 3
+        # Undo the previous attempt at this depth, if any
+        num = grid[r, c]
+        if num != 0:
+            bit = 1 << num
+            row[r] ^= bit
+            col[c] ^= bit
+            box[b] ^= bit
+            grid[r, c] = 0
+        cand = stack_cand[depth]
+        if cand == 0:
+            depth -= 1
+            continue
+        # Lowest remaining candidate; its digit is the number of bits below it
+        bit = cand & -cand
+        num = _popcount(bit - 1)
+        stack_cand[depth] = cand ^ bit
+        grid[r, c] = num
+        row[r] |= bit
+        col[c] |= bit
+        box[b] |= bit
+        cell, cand = _pick_cell(grid, row, col, box)
+        if cell < 0:
+            return True
+        depth += 1
+        stack_cell[depth] = cell
+        stack_cand[depth] = cand
+    return False
+
+def solve_array(grid: bytearray) -> bool:
+    """
+    Builds the bitmasks for grid and solves it in place with the compiled core.
+    The buffer is wrapped as a 9x9 int8 array without copying.
+    :param grid: Flat 81-cell bytearray (row-major, 0 for empty)
+    :return: True if solved, False otherwise
+    """
+    grid = np.frombuffer(grid, dtype=np.int8).reshape(9, 9)
+    row = np.zeros(9, dtype=np.int32)
+    col = np.zeros(9, dtype=np.int32)
+    box = np.zeros(9, dtype=np.int32)
+    if not init_masks(grid, row, col, box):
+        return False
+    return solve_nb(grid, row, col, box)